@@ -3,7 +3,6 @@
 from __future__ import absolute_import
 
 from annoying.functions import get_object_or_None
-from pbkdf2 import crypt
 
 from django.conf import settings; logging = settings.LOG
 from django.contrib.auth.models import check_password
@@ -12,7 +11,7 @@ from django.db import models, transaction
 from django.utils.translation import ugettext_lazy as _
 
 from fle_utils.config.models import Settings
-from fle_utils.django_utils.users import verify_raw_password
+from fle_utils.django_utils.users import crypt, verify_raw_password
 from securesync.models import DeviceZone
 from securesync.engine.models import DeferredCountSyncedModel
 
@@ -33,6 +32,9 @@ class Facility(DeferredCountSyncedModel):
     class Meta:
         verbose_name_plural = _("Facilities")
         app_label = "securesync"  # for back-compat reasons
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     def __unicode__(self):
         if not self.id:
@@ -89,6 +91,9 @@ class FacilityGroup(DeferredCountSyncedModel):
 
     class Meta:
         app_label = "securesync"  # for back-compat reasons
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     def __unicode__(self):
         return self.name
@@ -148,6 +153,9 @@ class FacilityUser(DeferredCountSyncedModel):
 
     class Meta:
         app_label = "securesync"  # for back-compat reasons
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     def __unicode__(self):
         return u"%s (Facility: %s)" % (self.get_name(), self.facility)
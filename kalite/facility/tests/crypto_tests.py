@@ -2,8 +2,10 @@
 """
 from django.conf import settings
 from django.utils import unittest
+from pbkdf2 import crypt as pbkdf2_crypt
 
 from ..models import FacilityUser
+from fle_utils.django_utils.users import crypt
 
 
 class TestPasswordSetting(unittest.TestCase):
@@ -45,3 +47,15 @@ class TestPasswordSetting(unittest.TestCase):
             fu.set_password(hashed_password=self.__class__.hashed_blah)
         settings.DEBUG = dbg_mode
 
+
+class TestCrypt(unittest.TestCase):
+
+    hashed_blah = "$p5k2$7d0$gTQ4yyg2$cixFA2fd5QUfmKLPWZYIVxoZwymFajCK"
+
+    def test_crypt_checks_existing_hash(self):
+        self.assertEqual(crypt("blah", self.__class__.hashed_blah), self.__class__.hashed_blah)
+        self.assertNotEqual(crypt("blue", self.__class__.hashed_blah), self.__class__.hashed_blah)
+
+    def test_crypt_matches_pbkdf2(self):
+        for iterations in (None, 400, 2500):
+            self.assertEqual(crypt(u"bl\xe9h", "gTQ4yyg2", iterations=iterations), pbkdf2_crypt(u"bl\xe9h", "gTQ4yyg2", iterations=iterations))
@@ -14,6 +14,9 @@ class ContentRating(DeferredCountSyncedModel):
 
     class Meta:
         unique_together = ("content_source", "content_kind", "content_id", "user")
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     # Maintain info on content type -- could be video, exercise, etc, but we should be able to uniquely id it
     content_kind = models.CharField(max_length=100, db_index=True, blank=False)
@@ -26,11 +29,11 @@ class ContentRating(DeferredCountSyncedModel):
     text = models.TextField(blank=True)
 
     def get_uuid(self):
-        assert self.user is not None and self.user.id is not None, "User ID required for get_uuid"
+        assert self.user_id is not None, "User ID required for get_uuid"
         assert self.content_id is not None, "Content id required for get_uuid"
         assert self.content_kind is not None, "Content kind required for get_uuid"
         assert self.content_source is not None, "Content source required for get_uuid"
 
-        namespace = uuid.UUID(self.user.id)
+        namespace = uuid.UUID(self.user_id)  # raw id, so we don't fetch the user just to get its id
         hashtext = ":".join([self.__class__.__name__, self.content_source, self.content_kind, self.content_id])
         return uuid.uuid5(namespace, hashtext.encode("utf-8")).hex
\ No newline at end of file
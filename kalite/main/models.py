@@ -46,7 +46,9 @@ class VideoLog(DeferredCountSyncedModel):
         self._unhashable_fields += ("latest_activity_timestamp",) # since it's being stripped out by minversion, we can't include it in the signature
 
     class Meta:  # needed to clear out the app_name property from SyncedClass.Meta
-        pass
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     def __unicode__(self):
         return u"user=%s, video_id=%s, youtube_id=%s, seconds=%d, points=%d, language=%s%s" % (
@@ -80,10 +82,10 @@ class VideoLog(DeferredCountSyncedModel):
         super(VideoLog, self).save(*args, **kwargs)
 
     def get_uuid(self, *args, **kwargs):
-        assert self.user is not None and self.user.id is not None, "User ID required for get_uuid"
+        assert self.user_id is not None, "User ID required for get_uuid"
         assert self.video_id is not None, "video_id is required for get_uuid"
 
-        namespace = uuid.UUID(self.user.id)
+        namespace = uuid.UUID(self.user_id)  # raw id, so we don't fetch the user just to get its id
         # can be video_id because that's set to the english youtube_id, to match past code.
         return uuid.uuid5(namespace, self.video_id.encode("utf-8")).hex
 
@@ -115,7 +117,9 @@ class ExerciseLog(DeferredCountSyncedModel):
         self._unhashable_fields += ("latest_activity_timestamp",) # since it's being stripped out by minversion, we can't include it in the signature
 
     class Meta:  # needed to clear out the app_name property from SyncedClass.Meta
-        pass
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     def __unicode__(self):
         return u"user=%s, exercise_id=%s, points=%d, language=%s%s" % (self.user, self.exercise_id, self.points, self.language, " (completed)" if self.complete else "")
@@ -142,10 +146,10 @@ class ExerciseLog(DeferredCountSyncedModel):
         super(ExerciseLog, self).save(*args, **kwargs)
 
     def get_uuid(self, *args, **kwargs):
-        assert self.user is not None and self.user.id is not None, "User ID required for get_uuid"
+        assert self.user_id is not None, "User ID required for get_uuid"
         assert self.exercise_id is not None, "Exercise ID required for get_uuid"
 
-        namespace = uuid.UUID(self.user.id)
+        namespace = uuid.UUID(self.user_id)  # raw id, so we don't fetch the user just to get its id
         return uuid.uuid5(namespace, self.exercise_id.encode("utf-8")).hex
 
     @classmethod
@@ -182,7 +186,9 @@ class UserLogSummary(DeferredCountSyncedModel):
     last_activity_datetime = models.DateTimeField(blank=True, null=True); last_activity_datetime.minversion = "0.10.3"
 
     class Meta:  # needed to clear out the app_name property from SyncedClass.Meta
-        pass
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     def __unicode__(self):
         self.full_clean()  # make sure everything that has to be there, is there.
@@ -493,6 +499,7 @@ class AttemptLog(DeferredCountSyncedModel):
     class Meta:
         index_together = [
             ["user", "exercise_id", "context_type"],
+            ["signed_by", "counter"],
         ]
 
 
@@ -522,7 +529,9 @@ class ContentLog(DeferredCountSyncedModel):
         self._unhashable_fields += ("latest_activity_timestamp",) # since it's being stripped out by minversion, we can't include it in the signature
 
     class Meta:  # needed to clear out the app_name property from SyncedClass.Meta
-        pass
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     @staticmethod
     def get_points_for_user(user):
@@ -534,12 +543,12 @@ class ContentLog(DeferredCountSyncedModel):
         super(ContentLog, self).save(*args, **kwargs)
 
     def get_uuid(self):
-        assert self.user is not None and self.user.id is not None, "User ID required for get_uuid"
+        assert self.user_id is not None, "User ID required for get_uuid"
         assert self.content_id is not None, "Content id required for get_uuid"
         assert self.content_kind is not None, "Content kind required for get_uuid"
         assert self.content_source is not None, "Content source required for get_uuid"
 
-        namespace = uuid.UUID(self.user.id)
+        namespace = uuid.UUID(self.user_id)  # raw id, so we don't fetch the user just to get its id
         hashtext = ":".join([self.__class__.__name__, self.content_source, self.content_kind, self.content_id])
         return uuid.uuid5(namespace, hashtext.encode("utf-8")).hex
 
@@ -120,6 +120,21 @@ class TestVideoLogs(KALiteTestCase):
         self.assertEqual(videolog2.points, self.NEW_POINTS, "The VideoLog's points were not updated.")
         self.assertEqual(videolog2.total_seconds_watched, self.NEW_SECONDS_WATCHED, "The VideoLog's total seconds watched were not updated.")
 
+    def test_videolog_same_id_updates(self):
+
+        # create a new VideoLog for the same video and user, so it gets the same (deterministic) id
+        videolog = VideoLog(video_id=self.VIDEO_ID, youtube_id=self.YOUTUBE_ID, user=self.user)
+        videolog.points = self.NEW_POINTS
+        videolog.total_seconds_watched = self.NEW_SECONDS_WATCHED
+
+        # saving should update the existing row, rather than trying to insert a duplicate
+        videolog.save()
+
+        # make sure the existing VideoLog was updated
+        self.assertEqual(videolog.id, self.original_videolog.id, "The new VideoLog did not get the same id.")
+        self.assertEqual(VideoLog.objects.filter(user=self.user, video_id=self.VIDEO_ID).count(), 1, "A duplicate VideoLog was created.")
+        self.assertEqual(VideoLog.objects.get(id=self.original_videolog.id).points, self.NEW_POINTS, "The VideoLog's points were not updated.")
+
     @unittest.skip("Auto-merging is not yet automatic, so skip this")
     def test_videolog_collision(self):
 
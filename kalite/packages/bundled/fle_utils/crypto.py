@@ -227,8 +227,9 @@ def hashed(message):
     return hashlib.sha1(message).digest()
     
 def encode_base64(data):
-    return base64.encodestring(data).replace("\n", "")
+    # b64encode doesn't insert line breaks, so there's nothing to strip out afterwards
+    return base64.b64encode(data)
 
 def decode_base64(data):
-    return base64.decodestring(data)
+    return base64.b64decode(data)
     
\ No newline at end of file
@@ -85,16 +85,17 @@ def Deserializer(stream_or_string, **options):
     """
     Deserialize a stream or string of JSON data.
 
-    Note: no change from Django version,
-      but needed to import here to use the versioned python deserializer
-      (see the import at the top for PythonDeserializer)
+    Note: needed to import here to use the versioned python deserializer
+      (see the import at the top for PythonDeserializer).
+      Unlike the Django version, strings are parsed directly, rather than
+      wrapped in a StringIO (whose read() would make a full copy of the payload).
     """
-    if isinstance(stream_or_string, basestring):
-        stream = StringIO(stream_or_string)
-    else:
-        stream = stream_or_string
     try:
-        for obj in PythonDeserializer(simplejson.load(stream), **options):
+        if isinstance(stream_or_string, basestring):
+            object_list = simplejson.loads(stream_or_string)
+        else:
+            object_list = simplejson.load(stream_or_string)
+        for obj in PythonDeserializer(object_list, **options):
             yield obj
     except GeneratorExit:
         raise
@@ -1,10 +1,23 @@
 """
 """
+import os
 import string
+from base64 import b64encode
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 
+try:
+    from hashlib import pbkdf2_hmac
+except ImportError:
+    # Python < 2.7.8 has no (C-implemented) PBKDF2 in hashlib; use the pure-Python one.
+    pbkdf2_hmac = None
+    from pbkdf2 import crypt as pbkdf2_crypt
+
+
+PBKDF2_SALT_CHARS = string.ascii_letters + string.digits + "./"
+PBKDF2_DEFAULT_ITERATIONS = 400
+
 
 def verify_raw_password(password, min_length=None):
     min_length = min_length or getattr(settings, "PASSWORD_CONSTRAINTS", {}).get('min_length', 0)
@@ -13,3 +26,47 @@ def verify_raw_password(password, min_length=None):
         raise ValidationError("Password should be at least %d characters." % min_length)
 
     return password
+
+
+def crypt(word, salt=None, iterations=None):
+    """
+    Drop-in replacement for pbkdf2.crypt: produces (and checks against) the same
+    "$p5k2$<iterations>$<salt>$<hash>" strings, so hashes still sync with other devices,
+    but computes PBKDF2-HMAC-SHA1 with hashlib's C implementation when available.
+
+    As with pbkdf2.crypt, pass a previous hash as the salt to check a password against it.
+    """
+    if pbkdf2_hmac is None:
+        return pbkdf2_crypt(word, salt=salt, iterations=iterations)
+
+    if salt is None:
+        salt = b64encode(os.urandom(6), "./")
+    salt = str(salt)  # the salt must be ASCII
+
+    if isinstance(word, unicode):
+        word = word.encode("utf-8")
+
+    # extract the real salt and iteration count from a previous hash
+    if salt.startswith("$p5k2$"):
+        (iterations, salt, _) = salt.split("$")[2:5]
+        if not iterations:
+            iterations = PBKDF2_DEFAULT_ITERATIONS
+        else:
+            converted = int(iterations, 16)
+            if iterations != "%x" % converted or converted < 1:  # lowercase hex, minimum digits
+                raise ValueError("Invalid salt")
+            iterations = converted
+
+    for ch in salt:
+        if ch not in PBKDF2_SALT_CHARS:
+            raise ValueError("Illegal character %r in salt" % ch)
+
+    if iterations is None or iterations == PBKDF2_DEFAULT_ITERATIONS:
+        iterations = PBKDF2_DEFAULT_ITERATIONS
+        salt = "$p5k2$$" + salt
+    else:
+        salt = "$p5k2$%x$%s" % (iterations, salt)
+
+    # note: the full "$p5k2$..." prefix is what's used as the PBKDF2 salt
+    rawhash = pbkdf2_hmac("sha1", word, salt, iterations, 24)
+    return salt + "$" + b64encode(rawhash, "./")
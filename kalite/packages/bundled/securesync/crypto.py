@@ -13,6 +13,8 @@ from fle_utils.config.models import Settings
 from fle_utils.crypto import *
 
 _own_key = None
+_public_keys = {}  # public-key-only Key objects, by public key string (parsing keys isn't cheap)
+PUBLIC_KEY_CACHE_SIZE = 128
 
 def load_keys():
     global _own_key
@@ -46,3 +48,15 @@ def get_own_key():
     if not _own_key:
         load_keys()
     return _own_key
+
+def get_public_key(public_key_string):
+    """
+    Get a (verify-only) Key object for the given public key string,
+    parsing each key string only once.
+    """
+    key = _public_keys.get(public_key_string)
+    if not key:
+        if len(_public_keys) >= PUBLIC_KEY_CACHE_SIZE:
+            _public_keys.clear()
+        key = _public_keys[public_key_string] = Key(public_key_string=public_key_string)
+    return key
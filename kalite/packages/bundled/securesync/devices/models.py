@@ -2,6 +2,7 @@
 """
 import datetime
 import logging
+import threading
 import uuid
 from annoying.functions import get_object_or_None
 
@@ -109,6 +110,9 @@ class Zone(SyncedModel):
 
     class Meta:
         app_label = "securesync"
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     #@central_server_only  # causes circular loop, to include here
     def get_org(self):
@@ -125,7 +129,7 @@ class Zone(SyncedModel):
         """
         try:
             return ChainOfTrust(zone=self, device=device).verify()
-        except:
+        except Exception:
             return False
 
     @validate_via_booleans
@@ -156,6 +160,9 @@ class DeviceZone(SyncedModel):
 
     class Meta:
         app_label = "securesync"
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
     @validate_via_booleans
     def validate(self):
@@ -198,6 +205,7 @@ class Device(SyncedModel):
 
     key = None
     own_device = None  # cached property, shared globally.
+    _own_device_lock = threading.RLock()  # so concurrent requests don't each look up (or create) the own device
 
     class Meta:
         app_label = "securesync"
@@ -216,7 +224,7 @@ class Device(SyncedModel):
                 # get_metadata can fail if the Device instance hasn't been persisted to the db
                 pass
             if not self.key and self.public_key:
-                self.key = crypto.Key(public_key_string=self.public_key)
+                self.key = crypto.get_public_key(self.public_key)
         return self.key
 
     def _hashable_representation(self):
@@ -290,11 +298,14 @@ class Device(SyncedModel):
     @classmethod
     def get_own_device(cls):
         if not cls.own_device:
-            devices = DeviceMetadata.objects.filter(is_own_device=True)
-            if devices.count() == 0:
-                cls.own_device = cls.initialize_own_device() # why don't we need name or description here?
-            else:
-                cls.own_device = devices[0].device
+            with cls._own_device_lock:
+                if not cls.own_device:
+                    # single query for the metadata and its device, rather than a count() and then a fetch
+                    metadata = DeviceMetadata.objects.filter(is_own_device=True).select_related("device")[:1]
+                    if not metadata:
+                        cls.own_device = cls.initialize_own_device() # why don't we need name or description here?
+                    else:
+                        cls.own_device = metadata[0].device
         return cls.own_device
 
     @classmethod
@@ -317,6 +328,10 @@ class Device(SyncedModel):
         metadata.is_trusted = settings.CENTRAL_SERVER  # this is OK to set, as DeviceMetata is NEVER synced.
         metadata.save()
 
+        # invalidate any previously cached own device (get_own_device caches the new one, and
+        #   callers such as tests may roll this device back out of the DB, so don't cache it here)
+        cls.own_device = None
+
         return own_device
 
     def __unicode__(self):
@@ -3,11 +3,10 @@
 import datetime
 import uuid
 import zlib
-from pbkdf2 import crypt
 
 from django.conf import settings
 from django.contrib.auth.models import check_password
-from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.db.models.base import ModelBase
@@ -24,6 +23,12 @@ from fle_utils.django_utils.debugging import validate_via_booleans
 from fle_utils.django_utils.classes import ExtendedModel
 
 
+# How datetimes are rendered in the hashable representation of a SyncedModel.
+#   Note: the hour is NOT zero-padded, so this must not be swapped for isoformat()/strftime,
+#   or the signatures of existing models would no longer verify.
+HASHABLE_DATETIME_FORMAT = "%04d-%02d-%02d %d:%02d:%02d"
+
+
 def _get_own_device():
     """
     To allow imports to resolve... the only ugly thing of this code separation.
@@ -51,8 +56,9 @@ class SyncSession(ExtendedModel):
         app_label = "securesync"
 
     def __unicode__(self):
-        return u"%s... -> %s..." % (self.client_device.pk[0:5],
-            (self.server_device and self.server_device.pk[0:5] or "?????"))
+        # use the raw ids, so we don't fetch the devices just to display them
+        return u"%s... -> %s..." % (self.client_device_id[0:5],
+            (self.server_device_id and self.server_device_id[0:5] or "?????"))
 
     def _hashable_representation(self):
         return "%s:%s:%s:%s" % (
@@ -194,6 +200,8 @@ class SyncedModel(ExtendedModel):
     _unhashable_fields = ("signature", "signed_by") # fields of this class to avoid serializing
     _always_hash_fields = ("signed_version", "id")  # fields of this class to always serialize (see note above for signed_version)
     _import_excluded_validation_fields = tuple()  # fields that should not be validated upon import
+    _hashable_fields_cache = {}  # default hashable fields, by class (computed on first use)
+    _hashable_accessors_cache = {}  # (attname, is_datetime) for each field name, by class (computed on first use)
 
     __metaclass__ = SyncedModelMetaclass
 
@@ -282,12 +290,17 @@ class SyncedModel(ExtendedModel):
         # now, we just need to check whether or not it is actually signed by that model's private key
         try:
             return self.signed_by.get_key().verify(self._hashable_representation(), self.signature)
-        except:
+        except Exception:
             return False
 
     @classmethod
     def _hashable_fields(cls, fields=None):
 
+        # the default list of fields only depends on the class, so only build it once
+        if not fields and cls in cls._hashable_fields_cache:
+            return cls._hashable_fields_cache[cls]
+        use_cache = not fields
+
         # if no fields were specified, build a list of all the model's field names
         if not fields:
             fields = [field.name for field in cls._meta.fields if field.name not in cls._unhashable_fields and not hasattr(field, "minversion")]
@@ -302,31 +315,41 @@ class SyncedModel(ExtendedModel):
         # certain fields should never be included
         fields = [field for field in fields if field not in cls._unhashable_fields]
 
+        if use_cache:
+            cls._hashable_fields_cache[cls] = fields
+
         return fields
 
+    @classmethod
+    def _hashable_accessors(cls):
+        """
+        For each field name, the attribute holding its raw value, and whether it's a datetime.
+        For foreign keys, that's the "_id" attribute, so hashing never fetches (or needs) the related model.
+        """
+        if cls not in cls._hashable_accessors_cache:
+            cls._hashable_accessors_cache[cls] = dict(
+                (field.name, (field.attname, isinstance(field, models.DateTimeField)))
+                for field in cls._meta.fields
+            )
+        return cls._hashable_accessors_cache[cls]
+
     def _hashable_representation(self, fields=None):
         fields = self._hashable_fields(fields)
+        accessors = self._hashable_accessors()
         chunks = []
         for field in fields:
 
-            try:
-                val = getattr(self, field)
-            except ObjectDoesNotExist as e:
-                # if it's a foreign key and is broken, just use the id of the related model
-                val = getattr(self, field + "_id")
+            (attname, is_datetime) = accessors[field]
+            val = getattr(self, attname)
 
             if val:
-                # convert models to just an id
-                if isinstance(val, models.Model):
-                    val = val.pk
-
                 # convert datetimes to a str in a predictable way
-                if isinstance(val, datetime.datetime):
-                    val = ("%04d-%02d-%02d %d:%02d:%02d" %
+                if is_datetime and isinstance(val, datetime.datetime):
+                    val = (HASHABLE_DATETIME_FORMAT %
                         (val.year, val.month, val.day, val.hour, val.minute, val.second))
 
                 # encode string value as UTF-8, replacing any invalid characters so they don't blow up the hashing
-                if isinstance(val, unicode):
+                elif isinstance(val, unicode):
                     val = val.encode("utf-8", "replace")
 
                 # add this field/val pair onto the chunks to include in the hash
@@ -334,11 +357,12 @@ class SyncedModel(ExtendedModel):
 
         return "&".join(chunks)
 
-    def save(self, imported=False, increment_counters=True, sign=True, *args, **kwargs):
+    def save(self, imported=False, increment_counters=True, sign=True, verified=None, *args, **kwargs):
         """
         Some of the heavy lifting happens here.  There are two saving scenarios:
         (a) We are saving an imported model.
             In this case, we need to make sure that the data check out (but nothing we mark on the object)
+            (pass in verified, if the caller already has the result of self.verify())
         (b) We are saving our own model
             In this case, we need to mark the model with appropriate fields, so that
             it can be sync'd (self.counter), and that it will verify (self.signature)
@@ -347,7 +371,9 @@ class SyncedModel(ExtendedModel):
             # imported models are signed by other devices; make sure they check out
             if not self.signed_by_id:
                 raise ValidationError("Imported models must be signed.")
-            if not self.verify():
+            if verified is None:
+                verified = self.verify()
+            if not verified:
                 raise ValidationError("Could not verify the imported model.")  #Imported model's signature did not match.")
 
             # call the base Django Model save to write to the DB
@@ -366,6 +392,8 @@ class SyncedModel(ExtendedModel):
 
             own_device = _get_own_device()
 
+            is_new_random_id = not self.id and self.__class__.get_uuid.im_func is SyncedModel.get_uuid.im_func  # before the id is set, below
+
             if increment_counters:
                 self.counter = own_device.increment_counter_position()
             else:
@@ -381,6 +409,12 @@ class SyncedModel(ExtendedModel):
                 self.set_id()
                 self.signature = None  # make sure the signature will be recomputed on sync
 
+            # a new model getting a random id (see get_uuid) can't be in the DB yet, so skip Django's
+            #   check for an existing row (a SELECT before every INSERT) and just insert.
+            #   (models with deterministic ids, e.g. the logs, may collide with an existing row, so must check)
+            if is_new_random_id and not args and not (kwargs.get("force_update") or kwargs.get("update_fields")):
+                kwargs["force_insert"] = True
+
             # call the base Django Model save to write to the DB
             super(SyncedModel, self).save(*args, **kwargs)
 
@@ -438,8 +472,8 @@ class SyncedModel(ExtendedModel):
         return zone == self.get_zone()
 
     def __unicode__(self):
-        pk = self.pk[0:5] if len(getattr(self, "pk", "")) >= 5 else "[unsaved]"
-        signed_by_pk = self.signed_by.pk[0:5] if self.signed_by and self.signed_by.pk else "[None]"
+        pk = self.pk[0:5] if len(self.pk or "") >= 5 else "[unsaved]"
+        signed_by_pk = self.signed_by_id[0:5] if self.signed_by_id else "[None]"  # raw id, so we don't fetch the device
         return u"%s... (Signed by: %s...)" % (pk, signed_by_pk)
 
 
@@ -472,7 +506,8 @@ class DeferredCountSyncedModel(DeferredSignSyncedModel):
         and temporarily set, to create the object ID.
         """
 
-        if not increment_counters:
+        # only default when unspecified; imports pass False explicitly, and set counter positions themselves
+        if increment_counters is None:
             increment_counters = settings.CENTRAL_SERVER
 
         super(DeferredCountSyncedModel, self).save(*args, increment_counters=increment_counters, **kwargs)
@@ -495,6 +530,9 @@ class SyncedLog(SyncedModel):
 
     class Meta:
         app_label = "securesync"
+        index_together = [
+            ["signed_by", "counter"],
+        ]
 
 
 class ImportPurgatory(ExtendedModel):
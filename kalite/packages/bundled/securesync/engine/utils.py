@@ -3,10 +3,10 @@ Used for labeling models that use securesync.
 This is where the heavy lifting happens!
 """
 import logging
-from annoying.functions import get_object_or_None
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
 from django.db.models.fields.related import ForeignKey
 
@@ -54,25 +54,44 @@ def get_device_counters(**kwargs):
     """Get device counters, filtered by zone"""
     assert ("zone" in kwargs) + ("devices" in kwargs) == 1, "Must specify zone or devices, and not both."
 
-    from ..devices.models import Device
-    devices = kwargs.get("devices") or Device.all_objects.by_zone(kwargs["zone"])  # include deleted objects
+    from ..devices.models import Device, DeviceMetadata
+
+    # by_zone joins across DeviceZones, so the same device can come back more than once
+    if kwargs.get("devices"):
+        device_ids = set(device.id for device in kwargs["devices"])
+    else:
+        device_ids = set(Device.all_objects.by_zone(kwargs["zone"]).values_list("id", flat=True))  # include deleted objects
+
+    # get the counter positions for all the devices at once, rather than device by device
+    metadata = dict((device_id, (counter_position, is_own_device)) for (device_id, counter_position, is_own_device)
+                    in DeviceMetadata.objects.filter(device__in=device_ids).values_list("device", "counter_position", "is_own_device"))
 
     device_counters = {}
-    for device in list(devices):
-        if device.id not in device_counters:  # why is this needed?
-            device_counters[device.id] = device.get_counter_position()
-
-            # The local device may have items that haven't incremented the device counter,
-            #   but instead have deferred until sync time.  Include those!
-            if device.is_own_device():
-                cnt = 0
-                for Model in _syncing_models:
-                    cnt += Model.all_objects.filter(Q(counter__isnull=True) | Q(signature__isnull=True)).count()  # include deleted records
-                device_counters[device.id] += cnt
+    for device_id in device_ids:
+        (counter_position, is_own_device) = metadata.get(device_id, (0, False))
+        device_counters[device_id] = counter_position
+
+        # The local device may have items that haven't incremented the device counter,
+        #   but instead have deferred until sync time.  Include those!
+        if is_own_device:
+            cnt = 0
+            for Model in _syncing_models:
+                cnt += Model.all_objects.filter(Q(counter__isnull=True) | Q(signature__isnull=True)).count()  # include deleted records
+            device_counters[device_id] += cnt
 
     return device_counters
 
 
+def _get_metadata(device):
+    """Use the DeviceMetadata pulled in by select_related, if there is one,
+    falling back to get_metadata (which will create it) otherwise."""
+    from ..devices.models import DeviceMetadata
+    try:
+        return device.devicemetadata
+    except DeviceMetadata.DoesNotExist:
+        return device.get_metadata()
+
+
 def get_models(device_counters=None, limit=None, zone=None, dest_version=None, **kwargs):
     """Serialize models for some intended version (dest_version)
     Default is our own version--i.e. include all known fields.
@@ -80,7 +99,7 @@ def get_models(device_counters=None, limit=None, zone=None, dest_version=None, *
     """
     limit = limit or settings.SYNCING_MAX_RECORDS_PER_REQUEST  # must be specified
 
-    from ..devices.models import Device # cannot be top-level, otherwise inter-dependency of this and models fouls things up
+    from ..devices.models import Device, DeviceZone # cannot be top-level, otherwise inter-dependency of this and models fouls things up
     own_device = Device.get_own_device()
 
     # Get the current version if none was specified
@@ -94,13 +113,36 @@ def get_models(device_counters=None, limit=None, zone=None, dest_version=None, *
 
     # if no devices specified, assume we're starting from zero, and include all devices in the zone
     if device_counters is None:
-        device_counters = dict((device.id, 0) for device in Device.all_objects.by_zone(zone))  # include deleted devices
+        device_counters = dict((device_id, 0) for device_id in Device.all_objects.by_zone(zone).values_list("id", flat=True))  # include deleted devices
+
+    # fetch all requested devices (and their metadata) in one go, along with their zone membership,
+    #   so we don't have to hit the database for each device below
+    devices = dict((device.id, device) for device in Device.all_objects.filter(pk__in=device_counters.keys()).select_related("devicemetadata"))  # include deleted devices
+    trusted = dict((device_id, _get_metadata(device).is_trusted) for device_id, device in devices.iteritems())
+    in_zone_ids = set(DeviceZone.objects.filter(device__in=devices.keys(), zone=zone, revoked=False).values_list("device", flat=True))
+    in_zone = dict((device_id, device_id in in_zone_ids) for device_id in devices)
 
     # remove all requested devices that either don't exist or aren't in the correct zone
-    for device_id in device_counters.keys():
-        device = get_object_or_None(Device.all_objects, pk=device_id)
-        if not device or not (device.in_zone(zone) or device.is_trusted()):
-            del device_counters[device_id]
+    device_counters = dict((device_id, counter) for device_id, counter in device_counters.iteritems()
+                           if device_id in devices and (in_zone[device_id] or trusted[device_id]))
+
+    # Build each device's filter once, up front; it doesn't depend on the model class.
+    device_filters = []
+    for device_id, counter in device_counters.iteritems():
+        # We need to track the min counter position (send things above this value)
+        counter_min = counter + 1
+
+        device_filter = Q(signed_by=devices[device_id]) | Q(signed_by__isnull=True) | Q(counter__isnull=True)
+
+        # for trusted (central) device, only include models with the correct fallback zone
+        if not in_zone[device_id]:
+            assert trusted[device_id], "Should never include devices not ACTUALLY in the zone, except trusted devices."
+            device_filter &= Q(zone_fallback=zone)
+
+        # Now select relevant items that have been updated since the last sync event
+        device_filter &= Q(counter__gte=counter_min) | Q(counter__isnull=True)
+
+        device_filters.append(device_filter)
 
     models = []
     remaining = limit
@@ -115,57 +157,16 @@ def get_models(device_counters=None, limit=None, zone=None, dest_version=None, *
         #   Do devices first, because each device is independent.
         #   Models within a device are highly dependent (on explicit dependencies,
         #   as well as counter position)
-        for device_id, counter in device_counters.items():
-            # We need to track the min counter position (send things above this value)
-            #   and the max (we're sending up to this value, so make sure nothing
-            #   below it is left behind)
-            counter_min = counter + 1
-            counter_max = 0
-
-            device = Device.all_objects.get(pk=device_id)
-
-            queryset = Model.all_objects.filter(Q(signed_by=device) | Q(signed_by__isnull=True) | Q(counter__isnull=True))
-
-            # for trusted (central) device, only include models with the correct fallback zone
-            if not device.in_zone(zone):
-                assert device.is_trusted(), "Should never include devices not ACTUALLY in the zone, except trusted devices."
-                queryset = queryset.filter(zone_fallback=zone)
-
-            # Now select relevant items that have been updated since the last sync event
-            queryset = queryset.filter(Q(counter__gte=counter_min) | Q(counter__isnull=True))
-            if not queryset:
-                continue
-
-            # Make sure you send anything that HAS to be sent (i.e. send anything that is BELOW
-            #   the max counter position that we do plan to send.  If we find things that we
-            #   unexpectedly need to send, make sure to add room for them.
+        #   (note: keep models as the OUTER loop; devices' models can depend on each other,
+        #   so all instances of a model must be sent before any instances of the models after it)
+        for device_filter in device_filters:
+            queryset = Model.all_objects.filter(device_filter)
 
             if remaining is None: # this means limit was None, so we just sync everything
-                new_models = queryset
+                new_models = list(queryset)
             else:
-                if counter_max is None:
-                    # If we're sending something with counter=None, then this will set
-                    #   the devicecounter above anything downstream, so these downstream items
-                    #   must be sent NOW
-                    remaining += max(0, (queryset.filter(counter__isnull=False).count() - remaining))
-                else:
-                    # If we're sending something with counter=10, then anything with a lower
-                    #   counter must be sent along with it.  So, squeeze it in
-                    remaining += max(0, (queryset.filter(counter__lt=counter_max).count() - remaining))
-
                 # Grab up to (remaining) model instances, then decrease the remaining to the total limit remaining
-                new_models = queryset[:remaining]
-
-            if not new_models:
-                continue
-
-            if counter_max is not None:
-                # None is the most severe, so only check if we're not already sending things with None
-                counters = [m.counter for m in new_models]
-                if None in counters:
-                    counter_max = None
-                else:
-                    counter_max = max(counter_max, max(counters))
+                new_models = list(queryset[:remaining])
 
             models += new_models
             if remaining is not None:
@@ -200,7 +201,7 @@ def get_serialized_models(*args, **kwargs):
         return serialized_models
 
 
-#@transaction.commit_on_success
+@transaction.commit_on_success
 def save_serialized_models(data, increment_counters=True, src_version=None, verbose=False):
     """Unserializes models (from a device of version=src_version) in data and saves them to the django database.
     If src_version is None, all unrecognized fields are (silently) stripped off.
@@ -237,8 +238,16 @@ def save_serialized_models(data, increment_counters=True, src_version=None, verb
     unsaved_models = []
     exceptions = ""
     saved_model_count = 0
+    counter_positions = {}  # highest counter seen for each signing device, to be set once all models are in
+
+    def track_counter_position(model):
+        (device, counter) = counter_positions.get(model.signed_by_id, (None, None))
+        if device is None or counter < model.counter:
+            counter_positions[model.signed_by_id] = (model.signed_by, model.counter)
+
     try:
         for modelwrapper in models:
+            verified = None  # result of verifying the model's signature, once we've done so
             try:
 
                 # extract the model from the deserialization wrapper
@@ -251,11 +260,28 @@ def save_serialized_models(data, increment_counters=True, src_version=None, verb
                 # TODO(jamalex): more robust way to do this? (otherwise, it might barf about the id already existing)
                 model._state.adding = False
 
-                # verify that all fields are valid, and that foreign keys can be resolved
-                model.full_clean(imported=True)
+                # clean, verify and save the model within a savepoint, so that a DB error in any of them
+                #   only rolls back this model, rather than aborting the whole import's transaction
+                #   (note: on backends without savepoint support, e.g. SQLite under Django 1.5, this does nothing)
+                sid = transaction.savepoint()
+                try:
+                    # verify that all fields are valid, and that foreign keys can be resolved
+                    model.full_clean(imported=True)
+
+                    # check the signature (the expensive part of importing) exactly once;
+                    #   save and the failure handling below both reuse the result
+                    verified = model.verify()
+
+                    # save the imported model (checking that the signature is valid in the process)
+                    model.save(imported=True, increment_counters=False, verified=verified)  # counters are set in bulk, below
+                except Exception:
+                    transaction.savepoint_rollback(sid)
+                    raise
+                transaction.savepoint_commit(sid)
 
-                # save the imported model (checking that the signature is valid in the process)
-                model.save(imported=True, increment_counters=increment_counters)
+                # For imported models, we want to keep track of the counter position we're at for that device.
+                if increment_counters:
+                    track_counter_position(model)
 
                 # keep track of how many models have been successfully saved
                 saved_model_count += 1
@@ -272,14 +298,25 @@ def save_serialized_models(data, increment_counters=True, src_version=None, verb
                 # if the model is at least properly signed, try incrementing the counter for the signing device
                 # (because otherwise we may never ask for additional models)
                 try:
-                    if increment_counters and model.verify():
-                        model.signed_by.set_counter_position(model.counter, soft_set=True)
+                    if increment_counters:
+                        if verified is None:
+                            verified = model.verify()
+                        if verified:
+                            track_counter_position(model)
                 except:
                     pass
 
     except Exception as e:
         exceptions += unicode(e)
 
+    # now that the models are in, move each signing device's counter position up to
+    #   the highest counter we received from it (once per device, rather than once per model)
+    for device, counter in counter_positions.values():
+        try:
+            device.set_counter_position(counter, soft_set=True)
+        except Exception as e:
+            exceptions += unicode(e)
+
     # deal with any models that didn't validate properly; throw them into purgatory so we can try again later
     if unsaved_models:
         if not purgatory:
@@ -1,5 +1,6 @@
 from base import *
 from crypto_tests import *
 from decorators import *
+from engine_tests import *
 from trust_tests import *
 from unicode_tests import *
@@ -1,11 +1,13 @@
 """
 """
+import datetime
 import os
 import re
 import tempfile
 
 from django.conf import settings
 from django.core.management import call_command
+from django.db import models
 from django.test import TestCase
 from django.utils import unittest
 
@@ -15,7 +17,7 @@ from ..models import Device
 from fle_utils.django_utils.command import call_command_with_output
 from kalite.facility.models import Facility, FacilityUser, FacilityGroup
 from securesync import crypto
-from securesync.models import Device, Zone, DeviceZone
+from securesync.models import Device, Zone, DeviceZone, ZoneInvitation
 
 
 @unittest.skipIf(not crypto.M2CRYPTO_EXISTS, "Skipping M2Crypto tests as it does not appear to be installed.")
@@ -269,3 +271,51 @@ class TestHashableFieldsAndSerialization(unittest.TestCase):
         g = FacilityGroup()
         possibly_worse_serialization = d._hashable_representation()
         self.assertIn("description=Test", possibly_worse_serialization, "Instantiating a FacilityGroup changed hashable representation of Device")
+
+
+class TestHashableForeignKeys(TestCase):
+
+    def test_foreign_key_hashed_by_id(self):
+        """Foreign keys are hashed using the raw id, without needing to fetch the related model."""
+
+        invitation = ZoneInvitation(zone_id="deadbeef", public_key="key", public_key_signature="sig")
+        with self.assertNumQueries(0):
+            serialization = invitation._hashable_representation()
+        self.assertIn("zone=deadbeef", serialization, "Hashable representation of ZoneInvitation did not include the zone id")
+
+
+class TestHashableForeignKeysCompatibility(SecuresyncTestCase):
+
+    def setUp(self):
+        super(TestHashableForeignKeysCompatibility, self).setUp()
+        self.setUp_fake_device()
+
+    def old_hashable_representation(self, model):
+        """The representation as it was built before foreign keys were hashed by id: fetch the related model, and use its pk."""
+        chunks = []
+        for field in model._hashable_fields():
+            val = getattr(model, field)
+            if val:
+                if isinstance(val, models.Model):
+                    val = val.pk
+                if isinstance(val, datetime.datetime):
+                    val = ("%04d-%02d-%02d %d:%02d:%02d" %
+                        (val.year, val.month, val.day, val.hour, val.minute, val.second))
+                if isinstance(val, unicode):
+                    val = val.encode("utf-8", "replace")
+                chunks.append("%s=%s" % (field, val))
+        return "&".join(chunks)
+
+    def test_foreign_key_signature_compatible(self):
+        """Models with foreign keys hash as they did when the related model was fetched, so existing signatures still verify."""
+
+        facility = Facility(name="MyFacility")
+        facility.save()
+        group = FacilityGroup(name="MyGroup", facility=facility)
+        group.save(sign=True, increment_counters=True)
+
+        # get a fresh copy from the DB, so the related facility isn't already cached
+        group = FacilityGroup.objects.get(id=group.id)
+
+        self.assertEqual(group._hashable_representation(), self.old_hashable_representation(group), "Hashable representation of FacilityGroup changed")
+        self.assertTrue(group.verify(), "Signed FacilityGroup did not verify after being fetched from the DB")
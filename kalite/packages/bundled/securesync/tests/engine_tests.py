@@ -0,0 +1,62 @@
+"""
+"""
+from .base import SecuresyncTestCase
+from .decorators import distributed_server_test
+from ..engine.utils import save_serialized_models, serialize
+from ..models import Device, Zone
+from fle_utils.crypto import Key
+from kalite.facility.models import Facility
+
+
+class TestSaveSerializedModels(SecuresyncTestCase):
+
+    def setUp(self):
+        super(TestSaveSerializedModels, self).setUp()
+        self.setUp_fake_device()
+
+    def create_device(self, name):
+        # self-signed, the same way initialize_own_device does it
+        device = Device(name=name)
+        device.set_key(Key())
+        device.sign(device=device)
+        super(Device, device).save(imported=True, increment_counters=False)
+        return device
+
+    def signed_zone(self, device, counter):
+        zone = Zone(name="Zone %d" % counter)
+        zone.counter = counter
+        zone.sign(device=device)
+        return zone
+
+    def test_counter_position_set_per_signing_device(self):
+        """After an import, each signing device's counter position is the highest counter it sent."""
+        device_a = self.create_device("DeviceA")
+        device_b = self.create_device("DeviceB")
+        zones = [
+            self.signed_zone(device_a, 3),
+            self.signed_zone(device_b, 2),
+            self.signed_zone(device_a, 7),
+            self.signed_zone(device_b, 4),
+            self.signed_zone(device_a, 5),
+        ]
+
+        results = save_serialized_models(serialize(zones, sign=False, increment_counters=False))
+
+        self.assertEqual(results["saved_model_count"], len(zones), "All models should have been imported: %s" % results.get("exceptions"))
+        self.assertEqual(Device.objects.get(id=device_a.id).get_counter_position(), 7, "DeviceA's counter position should be the highest counter it sent.")
+        self.assertEqual(Device.objects.get(id=device_b.id).get_counter_position(), 4, "DeviceB's counter position should be the highest counter it sent.")
+
+
+@distributed_server_test
+class TestSyncedModelSave(SecuresyncTestCase):
+
+    def setUp(self):
+        super(TestSyncedModelSave, self).setUp()
+        self.setUp_fake_device()
+
+    def test_new_model_saved_without_select(self):
+        """A new model gets a random id, so saving it is just the INSERT, without first checking for an existing row."""
+        facility = Facility(name="MyFacility")
+        with self.assertNumQueries(1):
+            facility.save()
+        self.assertTrue(Facility.objects.filter(id=facility.id).exists(), "Facility was not saved.")
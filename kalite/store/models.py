@@ -30,4 +30,6 @@ class StoreTransactionLog(DeferredCountSyncedModel):
     purchased_at = models.DateTimeField(blank=True, null=True)
 
     class Meta:  # needed to clear out the app_name property from SyncedClass.Meta
-        pass
+        index_together = [
+            ["signed_by", "counter"],
+        ]
@@ -23,4 +23,6 @@ class TestLog(DeferredCountSyncedModel):
     total_correct = models.IntegerField(blank=False, null=False, default=0)
 
     class Meta:  # needed to clear out the app_name property from SyncedClass.Meta
-        pass
+        index_together = [
+            ["signed_by", "counter"],
+        ]